@@ -7,7 +7,6 @@ import time
 from typing import Tuple
 import numpy as np
 import gymnasium as gym
-import matplotlib.pyplot as plt
 
 
 def make_env(is_slippery: bool, render: str | None = None):
@@ -72,7 +71,7 @@ def train_q_learning(
         eps = max(eps_end, eps * eps_decay)
 
         if (ep + 1) % max(1, (episodes // 10)) == 0:
-            recent = np.mean(rewards[-100:]) if len(rewards) >= 100 else np.mean(rewards)
+            recent = np.mean(rewards[-100:])  # slicing already handles < 100 episodes
             print(f"[{ep+1}/{episodes}] ε={eps:.3f}  recent win-rate≈{recent:.2f}")
 
     env.close()
@@ -91,6 +90,8 @@ def moving_average(x: list[float], k: int = 100) -> np.ndarray:
 
 
 def plot_learning_curve(rewards: list[float], title: str = "FrozenLake Q-learning"):
+    import matplotlib.pyplot as plt  # only needed with --show_curve; slow to import
+
     ma = moving_average(rewards, k=100)
     plt.figure(figsize=(7, 4.5))
     plt.plot(rewards, label="Reward (1 if success else 0)")
@@ -112,6 +113,7 @@ def print_policy(Q: np.ndarray, is_slippery: bool):
     env = make_env(is_slippery, render=None)
     desc = env.unwrapped.desc.astype(str)  # array of S/F/H/G characters
     policy = np.full((4, 4), "·", dtype=object)
+    greedy = np.argmax(Q, axis=1)  # best action for every state in one pass
 
     for s in range(env.observation_space.n):
         r, c = divmod(s, 4)
@@ -119,8 +121,7 @@ def print_policy(Q: np.ndarray, is_slippery: bool):
         if cell in ("H", "G"):  # holes & goal: leave as is
             policy[r, c] = cell
         else:
-            a = int(np.argmax(Q[s]))
-            policy[r, c] = arrows[a]
+            policy[r, c] = arrows[int(greedy[s])]
 
     print("\nPolicy (arrows = greedy action; H=hole, G=goal):")
     for r in range(4):
@@ -134,6 +135,7 @@ def rollout(Q: np.ndarray, is_slippery: bool, delay: float = 0.2, max_steps: int
     Uses render_mode='ansi' to get frame strings.
     """
     env = make_env(is_slippery, render="ansi")
+    greedy = np.argmax(Q, axis=1)  # Q is fixed here, so pick actions once
     state, _ = env.reset()
     done = False
     steps = 0
@@ -150,7 +152,7 @@ def rollout(Q: np.ndarray, is_slippery: bool, delay: float = 0.2, max_steps: int
             print(frame)
 
         # Greedy action
-        action = int(np.argmax(Q[state]))
+        action = int(greedy[state])
         state, reward, terminated, truncated, _ = env.step(action)
         done = terminated or truncated
         total_reward += reward
@@ -163,12 +165,13 @@ def rollout(Q: np.ndarray, is_slippery: bool, delay: float = 0.2, max_steps: int
 
 def evaluate(Q: np.ndarray, episodes: int = 200, is_slippery: bool = False) -> float:
     env = make_env(is_slippery, render=None)
+    greedy = np.argmax(Q, axis=1)  # Q is fixed here, so pick actions once
     wins = 0
     for ep in range(episodes):
         state, _ = env.reset()
         done = False
         while not done:
-            action = int(np.argmax(Q[state]))
+            action = int(greedy[state])
             state, reward, terminated, truncated, _ = env.step(action)
             done = terminated or truncated
         if reward > 0:
@@ -45,19 +45,15 @@ COL_HOLE = (40, 40, 50)
 COL_GOAL = (130, 230, 160)
 COL_AGENT = (240, 120, 80)
 FONT_COL = (230, 230, 240)
+TILE_COL = {b'S': COL_START, b'F': COL_FREE, b'H': COL_HOLE, b'G': COL_GOAL}
 
-def draw_board(screen, desc, cell, agent_rc, stats, tile=96, pad=10):
+def draw_board(screen, desc, cell, agent_rc, stats, font, tile=96, pad=10):
     H, W = desc.shape
     screen.fill(COL_BG)
     # tiles
     for r in range(H):
         for c in range(W):
-            ch = desc[r, c]
-            if ch == b'S': color = COL_START
-            elif ch == b'F': color = COL_FREE
-            elif ch == b'H': color = COL_HOLE
-            elif ch == b'G': color = COL_GOAL
-            else: color = COL_FREE
+            color = TILE_COL.get(desc[r, c], COL_FREE)
             rect = pg.Rect(pad + c*tile, pad + r*tile, tile-2, tile-2)
             pg.draw.rect(screen, color, rect, border_radius=12)
             pg.draw.rect(screen, COL_GRID, rect, width=2, border_radius=12)
@@ -69,7 +65,6 @@ def draw_board(screen, desc, cell, agent_rc, stats, tile=96, pad=10):
     pg.draw.circle(screen, COL_AGENT, (cx, cy), int(tile*0.28))
 
     # HUD
-    font = pg.font.SysFont("Menlo,Consolas,monospace", 18)
     lines = [
         f"Episodes: {stats['episodes']}   Wins: {stats['wins']}   Win rate: {stats['win_rate']:.2f}",
         f"Step: {stats['step']}   Slippery: {stats['slippery']}   Speed: {stats['speed']}x  ( +/- to change )",
@@ -87,6 +82,7 @@ def idx_to_rc(idx, width=4):
 def eval_episode(Q, is_slippery=False, autoplay=True, speed=1.0):
     env = make_env(is_slippery)
     desc = env.unwrapped.desc  # bytes array of S/F/H/G
+    greedy = np.argmax(Q, axis=1)  # Q is fixed during playback
     s, _ = env.reset()
     step = 0
     wins = 0
@@ -97,11 +93,10 @@ def eval_episode(Q, is_slippery=False, autoplay=True, speed=1.0):
     screen = pg.display.set_mode((pad*2 + W*tile, pad*2 + H*tile + 90))
     pg.display.set_caption("FrozenLake — Q-learning visualizer")
     clock = pg.time.Clock()
+    font = pg.font.SysFont("Menlo,Consolas,monospace", 18)  # load once, not per frame
     stats = {"episodes": 1, "wins": 0, "win_rate": 0.0, "step": 0,
              "slippery": is_slippery, "speed": speed}
     done = False
-    t_accum = 0.0
-    delay = max(0.03, 0.2 / max(0.25, min(4.0, speed)))  # frame pacing
 
     while True:
         # events
@@ -115,11 +110,11 @@ def eval_episode(Q, is_slippery=False, autoplay=True, speed=1.0):
                 if e.key in (pg.K_PLUS, pg.K_EQUALS): speed = min(4.0, speed + 0.25)
                 if e.key == pg.K_MINUS: speed = max(0.25, speed - 0.25)
         stats["speed"] = speed
-        delay = max(0.03, 0.2 / speed)
+        delay = max(0.03, 0.2 / speed)  # frame pacing
 
         # act
         if autoplay and not done:
-            a = int(np.argmax(Q[s]))
+            a = int(greedy[s])
             ns, r, term, trunc, _ = env.step(a)
             done = term or trunc
             s = ns
@@ -136,7 +131,7 @@ def eval_episode(Q, is_slippery=False, autoplay=True, speed=1.0):
 
         # draw
         agent_rc = idx_to_rc(s, 4)
-        draw_board(screen, desc, None, agent_rc, stats, tile=tile, pad=pad)
+        draw_board(screen, desc, None, agent_rc, stats, font, tile=tile, pad=pad)
         pg.display.flip()
         clock.tick(60)
         time.sleep(delay)
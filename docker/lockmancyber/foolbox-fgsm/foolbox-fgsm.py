@@ -53,7 +53,7 @@ def foolbox_fgsm():
 
     return jsonify({
         'original': to_base64(img_tensor.squeeze()),
-        'adversarial': to_base64(torch.tensor(adv_image).squeeze())
+        'adversarial': to_base64(adv_image.squeeze())
     })
 
 if __name__ == "__main__":
@@ -24,7 +24,7 @@ preprocessing = transforms.Compose([
 
 # Load ImageNet class labels
 with open("imagenet_classes.txt") as f:
-    labels = [line.strip() for line in f.readlines()]
+    labels = [line.strip() for line in f]
 
 @app.route("/api/resnet/classify", methods=["POST"])
 def classify():
@@ -34,7 +34,8 @@ def classify():
     image = Image.open(request.files['file']).convert('RGB')
     input_tensor = preprocessing(image).unsqueeze(0)
 
-    with torch.no_grad():
+    # Inference only: skip autograd bookkeeping entirely
+    with torch.inference_mode():
         output = model(input_tensor)
         _, predicted_idx = torch.max(output, 1)
         label = labels[predicted_idx.item()]
@@ -16,13 +16,16 @@ CORS(app)
 # Load pretrained ResNet18
 model = models.resnet18(pretrained=True).eval()
 
+# ImageNet normalization
+normalize = transforms.Normalize(mean=[0.485, 0.456, 0.406],
+                                 std=[0.229, 0.224, 0.225])
+
 # Normalized transform (for classification)
 preprocessing = transforms.Compose([
     transforms.Resize(256),
     transforms.CenterCrop(224),
     transforms.ToTensor(),
-    transforms.Normalize(mean=[0.485, 0.456, 0.406],
-                         std=[0.229, 0.224, 0.225]),
+    normalize,
 ])
 
 # Raw transform (no normalization)
@@ -32,9 +35,15 @@ raw_transform = transforms.Compose([
     transforms.ToTensor()
 ])
 
+# Inverse of the ImageNet normalization (for display)
+inv_normalize = transforms.Normalize(
+    mean=[-0.485 / 0.229, -0.456 / 0.224, -0.406 / 0.225],
+    std=[1 / 0.229, 1 / 0.224, 1 / 0.225]
+)
+
 # Load ImageNet labels
 with open("imagenet_classes.txt") as f:
-    labels = [line.strip() for line in f.readlines()]
+    labels = [line.strip() for line in f]
 
 # Foolbox model wrapper
 fmodel = fb.PyTorchModel(model, bounds=(0, 1), preprocessing=dict(
@@ -51,7 +60,8 @@ def classify():
     image = Image.open(request.files['file']).convert('RGB')
     input_tensor = preprocessing(image).unsqueeze(0)
 
-    with torch.no_grad():
+    # Inference only: skip autograd bookkeeping entirely
+    with torch.inference_mode():
         output = model(input_tensor)
         _, predicted_idx = torch.max(output, 1)
         label = labels[predicted_idx.item()]
@@ -71,11 +81,11 @@ def foolbox_attack():
     raw_tensor = raw_transform(image).unsqueeze(0)  # [1, 3, 224, 224]
     ep_tensor = ep.astensor(raw_tensor)
 
-    print("DEBUG: raw_tensor shape →", raw_tensor.shape)
+    app.logger.debug("raw_tensor shape → %s", raw_tensor.shape)
 
-    # Get label from normalized input
+    # Get label from normalized input (reuse the resized/cropped tensor)
     with torch.no_grad():
-        norm_tensor = preprocessing(image).unsqueeze(0)
+        norm_tensor = normalize(raw_tensor)
         output = model(norm_tensor)
         _, label_tensor = torch.max(output, 1)
     label = label_tensor.item()
@@ -92,10 +102,6 @@ def foolbox_attack():
     adversarial_tensor = torch.clamp(adversarial_tensor, 0, 1)
 
     # Unnormalize for display
-    inv_normalize = transforms.Normalize(
-        mean=[-0.485 / 0.229, -0.456 / 0.224, -0.406 / 0.225],
-        std=[1 / 0.229, 1 / 0.224, 1 / 0.225]
-    )
     image_for_output = inv_normalize(adversarial_tensor.squeeze(0))
     image_for_output = torch.clamp(image_for_output, 0, 1)
 
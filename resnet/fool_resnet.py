@@ -21,10 +21,11 @@ normalize = transforms.Normalize(mean=[0.485, 0.456, 0.406],
 
 # Load ImageNet labels
 with open("imagenet_classes.txt") as f:
-    labels = [line.strip() for line in f.readlines()]
+    labels = [line.strip() for line in f]
 
 # Attack config
 attack = FGSM()
+epsilon = 0.1  # You can tweak this (0.01–0.1 usually works)
 
 # Process each image in the images folder
 image_dir = "images"
@@ -43,9 +44,8 @@ for filename in os.listdir(image_dir):
         pred = torch.argmax(logits, dim=1).item()
     print(f"[Original] {filename} → {labels[pred]}")
 
-    # === Generate adversarial example (set epsilon strength here) ===
+    # === Generate adversarial example (epsilon set in attack config) ===
     label_tensor = torch.tensor([pred])
-    epsilon = 0.1  # You can tweak this (0.01–0.1 usually works)
     raw_adv, clipped_adv, is_adv = attack(fmodel, img_tensor, label_tensor, epsilons=epsilon)
 
     # === Get prediction on adversarial image ===
@@ -28,7 +28,7 @@ with torch.no_grad():
 
 # === Load labels from local file ===
 with open("imagenet_classes.txt") as f:
-    labels = [line.strip() for line in f.readlines()]
+    labels = [line.strip() for line in f]
 
 # === Get top prediction ===
 _, predicted = output.max(1)